@@ -3,33 +3,93 @@ Audio Processing API Endpoints.
 Provides REST API endpoints for audio processing operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any
-import json
+from typing import List, Dict, Any, Optional
+import asyncio
 import logging
-import os
+import secrets
+from pathlib import Path
 from datetime import datetime
+import aiofiles
+import orjson
 import soundfile as sf
 import librosa
 import numpy as np
 
-from app.core.dependencies import get_db_session, get_audio_manager, get_audio_buffer_manager
-from app.core.errors import SessionNotFoundError, AudioProcessingFailedError, EffectNotSupportedError
+from app.core.dependencies import (
+    get_db_session, get_audio_manager, get_audio_buffer_manager, get_buffer_pool, get_history_writer
+)
+from app.core.errors import (
+    SessionNotFoundError, AudioProcessingFailedError, EffectNotSupportedError, BufferConflictError
+)
 from app.models.pydantic import (
     CreateSessionRequest, ProcessAudioRequest,
     AudioSessionResponse, BufferStatusResponse, ProcessingResultResponse,
     AudioFileResponse, HealthCheckResponse, StatisticsResponse
 )
 from app.services.audio_processor import AudioProcessorFactory
-from app.models.db import AudioSession, ProcessingHistory, AudioFile
+from app.models.db import AudioSession, AudioFile
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/audio", tags=["audio"])
 
+# Upload bytes copied to disk per read
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# write_audio reads the raw body, so its accepted payloads are documented here
+_WRITE_AUDIO_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": {"type": "number"}}},
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+def _uploads_url(file_path: str) -> Optional[str]:
+    """
+    Return the URL of a file served by the /uploads static mount.
+    
+    Returns None when the file lies outside uploads_dir, e.g. when
+    PROCESSED_DIR points elsewhere, since it is then not served.
+    """
+    try:
+        relative = Path(file_path).resolve().relative_to(Path(settings.uploads_dir).resolve())
+    except ValueError:
+        return None
+    return f"/uploads/{relative.as_posix()}"
+
+
+def _decode_samples(body: bytes, content_type: str) -> np.ndarray:
+    """
+    Decode a request body into a 1-D float32 sample array.
+    
+    application/octet-stream bodies are raw little-endian float32 and are
+    wrapped with np.frombuffer without per-sample parsing; anything else
+    is treated as a JSON array of numbers.
+    
+    Raises:
+        ValueError: If the body is not a valid sample payload
+    """
+    if content_type.split(";")[0].strip() == "application/octet-stream":
+        if len(body) % 4 != 0:
+            raise ValueError("Binary body is not a whole number of float32 samples")
+        return np.frombuffer(body, dtype='<f4')
+    
+    try:
+        samples = np.asarray(orjson.loads(body), dtype=np.float32)
+    except (orjson.JSONDecodeError, TypeError) as e:
+        raise ValueError(f"Body must be a JSON array of numbers: {e}")
+    if samples.ndim != 1:
+        raise ValueError("Body must be a JSON array of numbers")
+    return samples
+
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check(
@@ -66,7 +126,8 @@ async def create_session(
 ):
     """Create a new audio processing session."""
     try:
-        session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Random ids cannot collide for sessions created in the same second
+        session_id = f"session_{secrets.token_hex(8)}"
         
         # Create audio buffer
         buffer = buffer_manager.create_buffer(
@@ -119,18 +180,28 @@ async def get_buffers(buffer_manager = Depends(get_audio_buffer_manager)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/{session_id}/write")
+@router.post("/{session_id}/write", openapi_extra=_WRITE_AUDIO_REQUEST_BODY)
 async def write_audio(
     session_id: str,
-    samples: List[float],
+    request: Request,
     buffer_manager = Depends(get_audio_buffer_manager)
 ):
-    """Write audio samples to a specific buffer."""
+    """
+    Write audio samples to a specific buffer.
+    
+    Accepts a JSON array of floats, or raw little-endian float32 samples
+    with Content-Type application/octet-stream.
+    """
     try:
         buffer = buffer_manager.get_buffer(session_id)
         if not buffer:
             raise SessionNotFoundError(f"Session {session_id} not found")
         
+        try:
+            samples = _decode_samples(await request.body(), request.headers.get("content-type", ""))
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        
         written = buffer.write(samples)
         
         return {
@@ -139,6 +210,8 @@ async def write_audio(
             "session_id": session_id
         }
         
+    except HTTPException:
+        raise
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -150,22 +223,38 @@ async def write_audio(
 async def read_audio(
     session_id: str,
     num_samples: int,
+    request: Request,
     amplitude: float = 1.0,
     buffer_manager = Depends(get_audio_buffer_manager)
 ):
-    """Read audio samples from a specific buffer."""
+    """
+    Read audio samples from a specific buffer.
+    
+    Clients sending Accept: application/octet-stream receive the samples
+    as raw little-endian float32 bytes, with the remaining sample count in
+    the X-Available-Samples header; otherwise the response is JSON.
+    """
     try:
         buffer = buffer_manager.get_buffer(session_id)
         if not buffer:
             raise SessionNotFoundError(f"Session {session_id} not found")
         
-        samples = buffer.read(num_samples, amplitude)
+        samples = buffer.read_ndarray(num_samples, amplitude)
         
-        return {
+        if "application/octet-stream" in request.headers.get("accept", ""):
+            return Response(
+                content=samples.astype('<f4', copy=False).tobytes(),
+                media_type="application/octet-stream",
+                headers={"X-Available-Samples": str(buffer.available_samples())}
+            )
+        
+        # Returned directly so orjson serialises the float32 array in C,
+        # skipping jsonable_encoder and a Python list of floats
+        return ORJSONResponse(content={
             "samples": samples,
             "available": buffer.available_samples(),
             "session_id": session_id
-        }
+        })
         
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -178,8 +267,9 @@ async def read_audio(
 async def process_audio(
     session_id: str,
     request: ProcessAudioRequest,
-    db: AsyncSession = Depends(get_db_session),
-    buffer_manager = Depends(get_audio_buffer_manager)
+    buffer_manager = Depends(get_audio_buffer_manager),
+    buffer_pool = Depends(get_buffer_pool),
+    history_writer = Depends(get_history_writer)
 ):
     """Apply audio effects to the buffer."""
     try:
@@ -192,34 +282,41 @@ async def process_audio(
         if available == 0:
             raise HTTPException(status_code=400, detail="No samples available for processing")
         
-        samples = buffer.read(available)
+        processing_time = 0.0
         
-        # Create processor and apply effect
-        processor = AudioProcessorFactory.create(request.effect.value, buffer.sample_rate)
-        processed_samples, processing_time = processor.process_with_timing(samples, request.parameters)
+        def apply_effect(samples: np.ndarray) -> np.ndarray:
+            nonlocal processing_time
+            with AudioProcessorFactory.acquire(request.effect.value, buffer.sample_rate) as processor:
+                processed, processing_time = processor.process_with_timing(samples, request.parameters)
+            return processed
         
-        # Write processed samples back
-        buffer.write(processed_samples)
+        # Process the buffered samples in place off the event loop; the NumPy
+        # and SciPy kernels release the GIL while they run. Pooled scratch is
+        # only used when the samples wrap around the ring.
+        processed_samples = await asyncio.to_thread(buffer.process_in_place, apply_effect, buffer_pool)
         
         # Save processed audio to file
         processed_file_path = None
+        processed_file_url = None
         try:
             processed_file_path = f"{settings.processed_dir}/processed_{session_id}_{request.effect.value}.wav"
-            sf.write(processed_file_path, processed_samples, buffer.sample_rate)
+            subtype = 'FLOAT' if settings.processed_float_output else 'PCM_16'
+            await asyncio.to_thread(
+                sf.write, processed_file_path, processed_samples, buffer.sample_rate, subtype=subtype
+            )
+            processed_file_url = _uploads_url(processed_file_path)
         except Exception as e:
             logger.warning(f"Could not save processed file: {e}")
         
-        # Log processing history
-        history = ProcessingHistory(
+        # Log processing history; rows are inserted in batches
+        history_writer.enqueue(
             session_id=session_id,
             effect=request.effect.value,
-            parameters=json.dumps(request.parameters),
+            parameters=request.parameters,
             samples_processed=len(processed_samples),
             processing_time_ms=processing_time,
             success=True
         )
-        db.add(history)
-        await db.commit()
         
         logger.info(f"Processed audio for session {session_id}: {request.effect.value}")
         
@@ -229,11 +326,14 @@ async def process_audio(
             samples_processed=len(processed_samples),
             processing_time_ms=processing_time,
             success=True,
-            processed_file_path=processed_file_path
+            processed_file_path=processed_file_path,
+            processed_file_url=processed_file_url
         )
         
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except BufferConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except AudioProcessingFailedError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -257,20 +357,18 @@ async def upload_audio_file(
                 detail=f"Unsupported audio format. Supported: {settings.supported_audio_formats}"
             )
         
-        # Save uploaded file
+        # Stream uploaded file to disk
         file_path = f"{settings.uploads_dir}/{file.filename}"
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        async with aiofiles.open(file_path, "wb") as out_file:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                await out_file.write(chunk)
         
-        # Load and analyze audio
-        samples, sr = librosa.load(file_path, sr=settings.default_sample_rate)
+        # Load audio as mono
+        samples, sr = await asyncio.to_thread(
+            librosa.load, file_path, sr=settings.default_sample_rate, mono=True
+        )
         duration = len(samples) / sr
         
-        # Convert to mono if stereo
-        if len(samples.shape) > 1:
-            samples = np.mean(samples, axis=1)
-        
         # Create metadata
         metadata = {
             'duration': duration,
@@ -305,7 +403,7 @@ async def upload_audio_file(
             size=len(samples),
             sample_rate=sr
         )
-        buffer.write(samples.tolist())
+        buffer.write(samples)
         
         # Store in database
         db_file = AudioFile(
@@ -389,37 +487,6 @@ async def get_statistics(audio_manager = Depends(get_audio_manager)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-
-
-
-@router.get("/processed/{session_id}/{effect}")
-async def get_processed_audio(
-    session_id: str,
-    effect: str,
-    audio_manager = Depends(get_audio_manager)
-):
-    """Get processed audio file."""
-    try:
-        # Construct the expected file path
-        file_path = f"{settings.processed_dir}/processed_{session_id}_{effect}.wav"
-        
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail="Processed audio file not found")
-        
-        # Return the file
-        return FileResponse(
-            path=file_path,
-            media_type="audio/wav",
-            filename=f"processed_{session_id}_{effect}.wav"
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error serving processed audio: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
 @router.delete("/{session_id}")
 async def delete_session(
     session_id: str,
@@ -3,12 +3,15 @@ Configuration settings for the Audio Processing Backend.
 Handles environment variables, database settings, and application configuration.
 """
 
+import atexit
 import os
+import queue
 from typing import Optional, List
 from pydantic_settings import BaseSettings
 from pydantic import Field
 import logging
 import logging.config
+import logging.handlers
 from pathlib import Path
 
 # Base directory
@@ -26,6 +29,9 @@ class Settings(BaseSettings):
     # Server
     host: str = Field(default="0.0.0.0", env="HOST")
     port: int = Field(default=8000, env="PORT")
+    thread_limiter_tokens: int = Field(default=200, env="THREAD_LIMITER_TOKENS")
+    ws_per_message_deflate: bool = Field(default=True, env="WS_PER_MESSAGE_DEFLATE")
+    ws_max_size: int = Field(default=16 * 1024 * 1024, env="WS_MAX_SIZE")
     
     # Database
     database_url: str = Field(
@@ -33,15 +39,19 @@ class Settings(BaseSettings):
         env="DATABASE_URL"
     )
     database_echo: bool = Field(default=False, env="DATABASE_ECHO")
+    database_pool_size: int = Field(default=20, env="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=10, env="DATABASE_MAX_OVERFLOW")
     
     # Audio Processing
     default_sample_rate: int = Field(default=44100, env="DEFAULT_SAMPLE_RATE")
     default_buffer_size: int = Field(default=44100, env="DEFAULT_BUFFER_SIZE")
     max_file_size_mb: int = Field(default=100, env="MAX_FILE_SIZE_MB")
+    max_audio_buffers: int = Field(default=256, env="MAX_AUDIO_BUFFERS")
     
     # Storage
     uploads_dir: str = Field(default="uploads", env="UPLOADS_DIR")
     processed_dir: str = Field(default="uploads/processed", env="PROCESSED_DIR")
+    processed_float_output: bool = Field(default=False, env="PROCESSED_FLOAT_OUTPUT")
     
     # Audio Effects
     reverb_backend: str = Field(default="pedalboard", env="REVERB_BACKEND")
@@ -114,18 +124,37 @@ def setup_logging() -> None:
         },
     }
     
+    logging.config.dictConfig(log_config)
+    
     # Add file handler if log_file is specified
     if settings.log_file:
-        log_config["handlers"]["file"] = {
-            "class": "logging.FileHandler",
-            "level": settings.log_level,
-            "formatter": "detailed",
-            "filename": settings.log_file,
-        }
-        log_config["loggers"][""]["handlers"].append("file")
-        log_config["loggers"]["app"]["handlers"].append("file")
+        _start_file_log_listener(log_config["formatters"]["detailed"])
+
+
+def _start_file_log_listener(formatter_config: dict) -> None:
+    """
+    Route file logging through a queue drained by a background thread.
     
-    logging.config.dictConfig(log_config)
+    Loggers only enqueue records, so request handlers never block on
+    log file writes.
+    
+    Args:
+        formatter_config: Format and date format for the file handler
+    """
+    file_handler = logging.FileHandler(settings.log_file)
+    file_handler.setLevel(settings.log_level)
+    file_handler.setFormatter(
+        logging.Formatter(formatter_config["format"], formatter_config["datefmt"])
+    )
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for logger_name in ("", "app"):
+        logging.getLogger(logger_name).addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def ensure_directories() -> None:
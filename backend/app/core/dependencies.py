@@ -8,9 +8,11 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
-from app.db.session import get_async_session
+from app.db.session import AsyncSessionLocal
 from app.services.audio_manager import AudioFileManager
 from app.services.audio_buffer import AudioBufferManager
+from app.services.buffer_pool import Float32BufferPool
+from app.services.history_writer import ProcessingHistoryWriter
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -18,19 +20,25 @@ logger = logging.getLogger(__name__)
 # Global singleton instances
 _audio_manager = None
 _buffer_manager = None
+_buffer_pool = None
+_history_writer = None
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session."""
-    async for session in get_async_session():
+    """
+    Dependency to get database session.
+    
+    Sessions check out a connection from the engine pool. Handler errors
+    are thrown in at the yield, so they are rolled back and the session is
+    closed here before the request finishes.
+    """
+    async with AsyncSessionLocal() as session:
         try:
             yield session
         except Exception as e:
             logger.error(f"Database session error: {e}")
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 async def get_audio_manager() -> AudioFileManager:
     """Dependency to get audio file manager."""
@@ -46,6 +54,20 @@ async def get_audio_buffer_manager() -> AudioBufferManager:
         _buffer_manager = AudioBufferManager()
     return _buffer_manager
 
+async def get_buffer_pool() -> Float32BufferPool:
+    """Dependency to get the float32 scratch buffer pool."""
+    global _buffer_pool
+    if _buffer_pool is None:
+        _buffer_pool = Float32BufferPool()
+    return _buffer_pool
+
+async def get_history_writer() -> ProcessingHistoryWriter:
+    """Dependency to get the batched processing history writer."""
+    global _history_writer
+    if _history_writer is None:
+        _history_writer = ProcessingHistoryWriter()
+    return _history_writer
+
 
 def get_current_user_id() -> Optional[str]:
     """Get current user ID from request context (placeholder for future authentication)."""
@@ -53,6 +53,11 @@ class EffectNotSupportedError(AudioProcessingError):
     pass
 
 
+class BufferConflictError(AudioProcessingError):
+    """Raised when a buffer changes while it is being processed."""
+    pass
+
+
 def create_error_response(
     message: str,
     error_code: str = None,
@@ -89,6 +94,8 @@ async def audio_processing_exception_handler(request: Request, exc: AudioProcess
         status_code = 400
     elif isinstance(exc, EffectNotSupportedError):
         status_code = 400
+    elif isinstance(exc, BufferConflictError):
+        status_code = 409
     
     return JSONResponse(
         status_code=status_code,
@@ -5,21 +5,55 @@ Handles async SQLAlchemy engine and session creation.
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event, text
 import logging
-from typing import AsyncGenerator
+import orjson
+from typing import Any, AsyncGenerator
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Engine options depend on the backend: an in-process SQLite file has no
+# network connection to go stale, so pre-ping would only add a round trip
+_is_sqlite = settings.database_url.startswith("sqlite")
+
+if _is_sqlite:
+    _engine_options = {
+        "pool_pre_ping": False,
+        "connect_args": {"check_same_thread": False, "cached_statements": 256},
+    }
+else:
+    _engine_options = {
+        "pool_pre_ping": True,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+    }
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON column values with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
-    pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_engine_options,
 )
 
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Use WAL so readers don't block the writer, and fsync only at checkpoints."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -49,11 +83,48 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# create_all skips existing tables, so indexes added after a table was
+# first created are applied here; superseded indexes are dropped
+_INDEX_MIGRATIONS = (
+    "CREATE INDEX IF NOT EXISTS idx_history_session_processed "
+    "ON processing_history (session_id, processed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_file_session_uploaded "
+    "ON audio_files (session_id, uploaded_at)",
+    "DROP INDEX IF EXISTS idx_history_session",
+    "DROP INDEX IF EXISTS idx_file_session",
+)
+
+# parameters columns created as Text before they became JSON; on PostgreSQL
+# the driver sends JSONB, which a text column rejects, so convert them once
+_POSTGRES_JSONB_COLUMNS = (
+    ("processing_history", "parameters"),
+    ("effect_presets", "parameters"),
+)
+_POSTGRES_JSONB_MIGRATION = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = '{table}' AND column_name = '{column}'
+          AND data_type = 'text'
+    ) THEN
+        ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb;
+    END IF;
+END $$
+"""
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            for statement in _INDEX_MIGRATIONS:
+                await conn.execute(text(statement))
+            if conn.dialect.name == "postgresql":
+                for table, column in _POSTGRES_JSONB_COLUMNS:
+                    await conn.execute(text(_POSTGRES_JSONB_MIGRATION.format(table=table, column=column)))
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
@@ -74,7 +145,6 @@ async def check_db_connection() -> bool:
     """Check if database connection is working."""
     try:
         async with engine.begin() as conn:
-            from sqlalchemy import text
             await conn.execute(text("SELECT 1"))
         return True
     except Exception as e:
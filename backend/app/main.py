@@ -3,19 +3,23 @@ Main FastAPI Application for the Audio Processing Backend.
 Entry point for the audio processing API with all routes and middleware.
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-import json
+from fastapi.responses import JSONResponse, ORJSONResponse
+import anyio.to_thread
 import logging
+import numpy as np
+import orjson
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.dependencies import get_audio_buffer_manager, get_history_writer
 from app.core.errors import register_exception_handlers
 from app.db.session import init_db, close_db, check_db_connection
 from app.api.endpoints import audio
 from app.services.audio_processor import AudioProcessorFactory
+from app.services.audio_buffer import AudioBufferManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,7 +30,8 @@ app = FastAPI(
     version=settings.app_version,
     description="High-performance audio processing API with real-time effects",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -36,6 +41,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Available-Samples"],
 )
 
 # Register exception handlers
@@ -48,13 +54,20 @@ app.mount("/uploads", StaticFiles(directory=settings.uploads_dir), name="uploads
 app.include_router(audio.router)
 
 # WebSocket connections (for future real-time features)
-active_connections: list[WebSocket] = []
+active_connections: set[WebSocket] = set()
+
+# Type tag of binary WebSocket frames carrying float32 audio samples
+WS_AUDIO_FRAME = 0x01
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
     try:
+        # Raise the worker thread cap used for sync dependencies, file
+        # responses and upload spooling (anyio defaults to 40)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_limiter_tokens
+        
         # Initialize database
         await init_db()
         
@@ -63,6 +76,10 @@ async def startup_event():
         if not db_connected:
             logger.error("Database connection failed")
         
+        # Start batched processing history inserts
+        history_writer = await get_history_writer()
+        history_writer.start()
+        
         # Log startup information
         logger.info(f"Starting {settings.app_name} v{settings.app_version}")
         logger.info(f"Supported effects: {AudioProcessorFactory.get_supported_effects()}")
@@ -79,11 +96,15 @@ async def startup_event():
 async def shutdown_event():
     """Clean up resources on shutdown."""
     try:
+        # Write queued processing history before closing the database
+        history_writer = await get_history_writer()
+        await history_writer.stop()
+        
         # Close database connections
         await close_db()
         
         # Close WebSocket connections
-        for connection in active_connections:
+        for connection in list(active_connections):
             await connection.close()
         
         logger.info("Application shutdown completed")
@@ -129,36 +150,88 @@ async def health_check():
 
 
 @app.websocket("/ws/audio/{session_id}")
-async def websocket_endpoint(websocket: WebSocket, session_id: str):
-    """WebSocket endpoint for real-time audio streaming (placeholder for future features)."""
+async def websocket_endpoint(
+    websocket: WebSocket,
+    session_id: str,
+    buffer_manager = Depends(get_audio_buffer_manager)
+):
+    """
+    WebSocket endpoint for real-time audio streaming.
+    
+    Text frames carry JSON control messages. Binary frames carry audio:
+    a one-byte type tag followed by raw little-endian float32 samples.
+    """
     await websocket.accept()
-    active_connections.append(websocket)
+    active_connections.add(websocket)
     
     try:
         logger.info(f"WebSocket connected for session: {session_id}")
         
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            
+            if frame.get("bytes") is not None:
+                reply = _handle_binary_frame(frame["bytes"], session_id, buffer_manager)
+                await websocket.send_text(orjson.dumps(reply).decode())
+                continue
+            
+            message = orjson.loads(frame["text"])
             
             if message["type"] == "ping":
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(orjson.dumps({
                     "type": "pong",
                     "timestamp": datetime.now().isoformat()
-                }))
+                }).decode())
             else:
                 # Placeholder for future real-time features
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(orjson.dumps({
                     "type": "not_implemented",
                     "message": "Feature not yet implemented"
-                }))
+                }).decode())
     
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
+        active_connections.discard(websocket)
         logger.info(f"WebSocket disconnected for session: {session_id}")
     except Exception as e:
         logger.error(f"WebSocket error for session {session_id}: {e}")
-        active_connections.remove(websocket)
+        active_connections.discard(websocket)
+
+
+def _handle_binary_frame(data: bytes, session_id: str, buffer_manager: AudioBufferManager) -> dict:
+    """
+    Handle a tagged binary WebSocket frame.
+    
+    Audio frames are decoded with np.frombuffer and written straight into
+    the session buffer, avoiding a JSON array of floats per sample.
+    
+    Args:
+        data: Raw frame payload including the type tag
+        session_id: Session the connection belongs to
+        buffer_manager: Audio buffer manager
+        
+    Returns:
+        JSON-serialisable reply message
+    """
+    if not data or data[0] != WS_AUDIO_FRAME:
+        return {"type": "error", "message": "Unknown binary frame type"}
+    
+    if (len(data) - 1) % 4 != 0:
+        return {"type": "error", "message": "Audio frame is not a whole number of float32 samples"}
+    
+    buffer = buffer_manager.get_buffer(session_id)
+    if buffer is None:
+        return {"type": "error", "message": f"Session {session_id} not found"}
+    
+    samples = np.frombuffer(data, dtype='<f4', offset=1)
+    written = buffer.write(samples)
+    
+    return {
+        "type": "buffer_status",
+        "written": written,
+        "available": buffer.available_samples()
+    }
 
 
 @app.get("/api/effects")
@@ -3,7 +3,7 @@ SQLAlchemy database models for the Audio Processing Backend.
 Defines the database schema for audio sessions, files, and processing history.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, Boolean, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import JSONB
@@ -12,6 +12,10 @@ from typing import Dict, Any, Optional
 
 from app.db.session import Base
 
+# JSON column stored as JSONB on PostgreSQL; the engine's orjson
+# serializer encodes and decodes values
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class AudioSession(Base):
     """Model for audio processing sessions."""
@@ -48,7 +52,7 @@ class ProcessingHistory(Base):
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(255), ForeignKey("audio_sessions.session_id"), nullable=False)
     effect = Column(String(100), nullable=False)
-    parameters = Column(Text)  # JSON string of effect parameters
+    parameters = Column(JSONType)  # Effect parameters
     processed_at = Column(DateTime(timezone=True), server_default=func.now())
     samples_processed = Column(Integer, default=0)
     processing_time_ms = Column(Float, default=0.0)
@@ -60,23 +64,10 @@ class ProcessingHistory(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_history_session', 'session_id'),
+        Index('idx_history_session_processed', 'session_id', 'processed_at'),
         Index('idx_history_effect', 'effect'),
         Index('idx_history_processed_at', 'processed_at'),
     )
-    
-    def get_parameters(self) -> Dict[str, Any]:
-        """Get parameters as dictionary."""
-        if self.parameters:
-            try:
-                return json.loads(self.parameters)
-            except json.JSONDecodeError:
-                return {}
-        return {}
-    
-    def set_parameters(self, params: Dict[str, Any]) -> None:
-        """Set parameters from dictionary."""
-        self.parameters = json.dumps(params)
 
 
 class AudioFile(Base):
@@ -113,7 +104,7 @@ class AudioFile(Base):
     
     # Indexes
     __table_args__ = (
-        Index('idx_file_session', 'session_id'),
+        Index('idx_file_session_uploaded', 'session_id', 'uploaded_at'),
         Index('idx_file_uploaded', 'uploaded_at'),
         Index('idx_file_format', 'format'),
     )
@@ -153,7 +144,7 @@ class EffectPreset(Base):
     user_id = Column(String(255), nullable=False)
     name = Column(String(255), nullable=False)
     effect_type = Column(String(100), nullable=False)
-    parameters = Column(Text, nullable=False)  # JSON string of parameters
+    parameters = Column(JSONType, nullable=False)  # Effect parameters
     description = Column(Text, nullable=True)
     is_public = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -165,17 +156,6 @@ class EffectPreset(Base):
         Index('idx_preset_type', 'effect_type'),
         Index('idx_preset_public', 'is_public'),
     )
-    
-    def get_parameters(self) -> Dict[str, Any]:
-        """Get parameters as dictionary."""
-        try:
-            return json.loads(self.parameters)
-        except json.JSONDecodeError:
-            return {}
-    
-    def set_parameters(self, params: Dict[str, Any]) -> None:
-        """Set parameters from dictionary."""
-        self.parameters = json.dumps(params)
 
 
 class AudioProject(Base):
@@ -64,6 +64,7 @@ class ProcessingResultResponse(BaseModel):
     processing_time_ms: float = Field(..., description="Processing time in milliseconds")
     success: bool = Field(..., description="Processing success status")
     processed_file_path: Optional[str] = Field(None, description="Path to processed audio file")
+    processed_file_url: Optional[str] = Field(None, description="URL of the processed audio file, if served under /uploads")
     error_message: Optional[str] = Field(None, description="Error message if processing failed")
 
 
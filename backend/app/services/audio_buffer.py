@@ -4,12 +4,15 @@ Provides thread-safe audio buffer management with circular buffer implementation
 """
 
 import numpy as np
+from collections import OrderedDict
 from threading import Lock
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Union
 import logging
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.errors import BufferConflictError
+from app.services.buffer_pool import Float32BufferPool
 
 logger = logging.getLogger(__name__)
 
@@ -42,17 +45,19 @@ class AudioBuffer:
         self.available = 0
         self.total_written = 0
         self.total_read = 0
+        # Bumped by clear() so in-flight transforms can detect a reset
+        self.generation = 0
         self.lock = Lock()
         self.created_at = datetime.now()
         
         logger.debug(f"Created audio buffer: size={size}, sample_rate={sample_rate}")
     
-    def write(self, samples: List[float]) -> int:
+    def write(self, samples: Union[np.ndarray, List[float]]) -> int:
         """
         Write samples to the buffer.
         
         Args:
-            samples: List of audio samples to write
+            samples: Audio samples to write, as a list or numpy array
             
         Returns:
             Number of samples actually written
@@ -64,7 +69,7 @@ class AudioBuffer:
                 return 0
             
             # Convert samples to numpy array
-            samples_array = np.array(samples[:samples_to_write], dtype=np.float32)
+            samples_array = np.asarray(samples[:samples_to_write], dtype=np.float32)
             
             # Handle wrap-around for write operation
             if self.write_ptr + samples_to_write <= self.size:
@@ -80,7 +85,7 @@ class AudioBuffer:
             self.available = min(self.available + samples_to_write, self.size)
             self.total_written += samples_to_write
             
-            logger.debug(f"Wrote {samples_to_write} samples to buffer")
+            logger.debug("Wrote %d samples to buffer", samples_to_write)
             return samples_to_write
     
     def read(self, num_samples: int, amplitude: float = 1.0) -> List[float]:
@@ -94,33 +99,193 @@ class AudioBuffer:
         Returns:
             List of audio samples
         """
+        return self.read_ndarray(num_samples, amplitude).tolist()
+    
+    def read_bytes(self, num_samples: int, amplitude: float = 1.0) -> bytes:
+        """
+        Read samples as raw little-endian float32 bytes.
+        
+        Avoids boxing every sample into a Python float, which makes it the
+        preferred transport for websocket and other binary consumers.
+        
+        Args:
+            num_samples: Number of samples to read
+            amplitude: Amplitude scaling factor
+            
+        Returns:
+            Raw float32 sample bytes
+        """
+        return self.read_ndarray(num_samples, amplitude).astype('<f4', copy=False).tobytes()
+    
+    def read_memoryview(self, num_samples: int, amplitude: float = 1.0) -> memoryview:
+        """
+        Read samples as a memoryview over a float32 array.
+        
+        Args:
+            num_samples: Number of samples to read
+            amplitude: Amplitude scaling factor
+            
+        Returns:
+            Memoryview of the read samples
+        """
+        return memoryview(self.read_ndarray(num_samples, amplitude))
+    
+    def read_ndarray(self, num_samples: int, amplitude: float = 1.0) -> np.ndarray:
+        """
+        Read samples as a float32 numpy array.
+        
+        Preferred for internal consumers such as effect processors, which
+        would otherwise convert the list from read() straight back.
+        
+        Args:
+            num_samples: Number of samples to read
+            amplitude: Amplitude scaling factor
+            
+        Returns:
+            Float32 array of audio samples
+        """
         with self.lock:
-            samples_to_read = min(num_samples, self.available)
-            if samples_to_read == 0:
-                logger.debug("No samples available for reading")
-                return []
+            result = np.empty(min(num_samples, self.available), dtype=np.float32)
+            self._read_locked(result, amplitude)
+            return result
+    
+    def peek(self, num_samples: int) -> np.ndarray:
+        """
+        Return upcoming samples without advancing the read pointer.
+    
+        Lets analysis code inspect buffered audio without a read followed
+        by a write-back. When the samples are contiguous in the ring the
+        result is a read-only view, otherwise a single copy; a view is
+        only valid until the samples are consumed and overwritten.
+    
+        Args:
+            num_samples: Maximum number of samples to return
+    
+        Returns:
+            Float32 array of up to num_samples samples
+        """
+        with self.lock:
+            samples_to_peek = min(num_samples, self.available)
+            end = self.read_ptr + samples_to_peek
+            if end <= self.size:
+                result = self.buffer[self.read_ptr:end]
+                result.flags.writeable = False
+                return result
+            return np.concatenate((self.buffer[self.read_ptr:], self.buffer[:end - self.size]))
+    
+    def process_in_place(
+        self,
+        transform: Callable[[np.ndarray], np.ndarray],
+        scratch_pool: Optional[Float32BufferPool] = None
+    ) -> np.ndarray:
+        """
+        Transform all buffered samples without consuming them.
+        
+        The unread samples are snapshotted under the buffer lock: a
+        read-only view of the ring when they are contiguous, otherwise a
+        copy gathered into pooled scratch. The transform runs without the
+        lock, so reads and writes on other threads are never held up by
+        it. Its output, which must have the same length, is stored back at
+        the same ring positions, replacing a full read followed by a write
+        of the processed samples. Writes that arrive meanwhile only fill
+        free space after the snapshot, so they are kept and left
+        unprocessed.
+        
+        Args:
+            transform: Function mapping a float32 array to a same-length array
+            scratch_pool: Optional pool for the wrap-around copy
             
-            result = np.zeros(samples_to_read, dtype=np.float32)
+        Returns:
+            The transform output, never aliasing the ring or scratch
             
-            # Handle wrap-around for read operation
-            if self.read_ptr + samples_to_read <= self.size:
-                # No wrap-around needed
-                result = self.buffer[self.read_ptr:self.read_ptr + samples_to_read].copy()
-            else:
-                # Wrap-around needed
-                first_chunk = self.size - self.read_ptr
-                result[:first_chunk] = self.buffer[self.read_ptr:]
-                result[first_chunk:] = self.buffer[:samples_to_read - first_chunk]
+        Raises:
+            ValueError: If the transform changes the number of samples
+            BufferConflictError: If the buffer was read or cleared while the
+                transform ran; the ring is left unchanged
+        """
+        scratch = None
+        with self.lock:
+            num_samples = self.available
+            start = self.read_ptr
+            total_read = self.total_read
+            generation = self.generation
+            end = start + num_samples
+            wrapped = end > self.size
             
-            # Apply amplitude scaling
-            result *= amplitude
+            if not wrapped:
+                samples = self.buffer[start:end]
+                samples.flags.writeable = False
+            else:
+                first_chunk = self.size - start
+                if scratch_pool is not None:
+                    scratch = scratch_pool.acquire(num_samples)
+                    samples = scratch
+                else:
+                    samples = np.empty(num_samples, dtype=np.float32)
+                samples[:first_chunk] = self.buffer[start:]
+                samples[first_chunk:] = self.buffer[:end - self.size]
+        
+        try:
+            result = transform(samples)
+            if len(result) != num_samples:
+                raise ValueError(
+                    f"In-place transform returned {len(result)} samples, expected {num_samples}"
+                )
             
-            self.read_ptr = (self.read_ptr + samples_to_read) % self.size
-            self.available -= samples_to_read
-            self.total_read += samples_to_read
+            # The caller keeps the result after the ring or scratch is reused
+            if np.may_share_memory(result, samples):
+                result = np.array(result, dtype=np.float32)
             
-            logger.debug(f"Read {samples_to_read} samples from buffer")
-            return result.tolist()
+            with self.lock:
+                if (self.read_ptr != start or self.total_read != total_read
+                        or self.generation != generation):
+                    raise BufferConflictError(
+                        "Buffer changed while it was being processed",
+                        error_code="BUFFER_CONFLICT"
+                    )
+                
+                if wrapped:
+                    self.buffer[start:] = result[:first_chunk]
+                    self.buffer[:end - self.size] = result[first_chunk:]
+                else:
+                    self.buffer[start:end] = result
+        finally:
+            if scratch is not None:
+                scratch_pool.release(scratch)
+        
+        logger.debug("Processed %d samples in place", num_samples)
+        return result
+    
+    def _read_locked(self, out: np.ndarray, amplitude: float) -> None:
+        """Copy len(out) samples into out and advance the read pointer. Caller holds the lock."""
+        samples_to_read = len(out)
+        if samples_to_read == 0:
+            logger.debug("No samples available for reading")
+            return
+        
+        # Copy and scale in one pass per contiguous chunk
+        if self.read_ptr + samples_to_read <= self.size:
+            # No wrap-around needed
+            self._copy_scaled(self.buffer[self.read_ptr:self.read_ptr + samples_to_read], amplitude, out)
+        else:
+            # Wrap-around needed
+            first_chunk = self.size - self.read_ptr
+            self._copy_scaled(self.buffer[self.read_ptr:], amplitude, out[:first_chunk])
+            self._copy_scaled(self.buffer[:samples_to_read - first_chunk], amplitude, out[first_chunk:])
+        
+        self.read_ptr = (self.read_ptr + samples_to_read) % self.size
+        self.available -= samples_to_read
+        self.total_read += samples_to_read
+        
+        logger.debug("Read %d samples from buffer", samples_to_read)
+    
+    @staticmethod
+    def _copy_scaled(src: np.ndarray, amplitude: float, out: np.ndarray) -> None:
+        """Copy src into out, applying amplitude scaling unless it is unity."""
+        if amplitude == 1.0:
+            np.copyto(out, src)
+        else:
+            np.multiply(src, amplitude, out=out)
     
     def available_samples(self) -> int:
         """Return number of samples available for reading."""
@@ -134,6 +299,7 @@ class AudioBuffer:
             self.read_ptr = 0
             self.write_ptr = 0
             self.available = 0
+            self.generation += 1
             logger.info("Buffer cleared")
     
     def get_status(self) -> Dict[str, Any]:
@@ -170,14 +336,21 @@ class AudioBufferManager:
     Manager for multiple audio buffers.
     
     Provides centralized management of audio buffers for different sessions,
-    including creation, deletion, and monitoring.
+    including creation, deletion, and monitoring. The number of buffers is
+    bounded; when it is exceeded the least recently used buffer is evicted.
     """
     
-    def __init__(self):
-        """Initialize the audio buffer manager."""
-        self.buffers: Dict[str, AudioBuffer] = {}
+    def __init__(self, max_buffers: int = None):
+        """
+        Initialize the audio buffer manager.
+        
+        Args:
+            max_buffers: Maximum number of buffers kept (defaults to config)
+        """
+        self.buffers: "OrderedDict[str, AudioBuffer]" = OrderedDict()
+        self.max_buffers = max_buffers or settings.max_audio_buffers
         self.lock = Lock()
-        logger.info("Audio buffer manager initialized")
+        logger.info(f"Audio buffer manager initialized: max_buffers={self.max_buffers}")
     
     def create_buffer(self, session_id: str, size: int = None, sample_rate: int = None) -> AudioBuffer:
         """
@@ -194,6 +367,7 @@ class AudioBufferManager:
         with self.lock:
             if session_id in self.buffers:
                 logger.warning(f"Buffer for session {session_id} already exists")
+                self.buffers.move_to_end(session_id)
                 return self.buffers[session_id]
             
             buffer_size = size or settings.default_buffer_size
@@ -202,13 +376,20 @@ class AudioBufferManager:
             buffer = AudioBuffer(buffer_size, buffer_sample_rate)
             self.buffers[session_id] = buffer
             
+            while len(self.buffers) > self.max_buffers:
+                evicted_id, _ = self.buffers.popitem(last=False)
+                logger.warning(f"Evicted least recently used buffer for session {evicted_id}")
+            
             logger.info(f"Created buffer for session {session_id}: size={buffer_size}, sample_rate={buffer_sample_rate}")
             return buffer
     
     def get_buffer(self, session_id: str) -> Optional[AudioBuffer]:
-        """Get buffer for a session."""
+        """Get buffer for a session, marking it as recently used."""
         with self.lock:
-            return self.buffers.get(session_id)
+            buffer = self.buffers.get(session_id)
+            if buffer is not None:
+                self.buffers.move_to_end(session_id)
+            return buffer
     
     def delete_buffer(self, session_id: str) -> bool:
         """Delete buffer for a session."""
@@ -233,8 +414,10 @@ class AudioBufferManager:
     
     def get_all_buffer_statuses(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all buffers."""
+        # Snapshot under the manager lock, then take each buffer lock on its own
         with self.lock:
-            return {session_id: buffer.get_status() for session_id, buffer in self.buffers.items()}
+            buffers = list(self.buffers.items())
+        return {session_id: buffer.get_status() for session_id, buffer in buffers}
     
     def clear_all_buffers(self) -> None:
         """Clear all buffers."""
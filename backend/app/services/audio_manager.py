@@ -5,7 +5,8 @@ Provides efficient audio file management using AVL tree and caching.
 
 import os
 import json
-import hashlib
+import secrets
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
@@ -285,9 +286,13 @@ class AudioFileManager:
         logger.info(f"Audio file manager initialized with storage path: {self.storage_path}")
     
     def generate_file_id(self, filename: str, file_size: int) -> str:
-        """Generate unique file ID."""
-        content = f"{filename}_{file_size}_{datetime.now().isoformat()}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """
+        Generate unique file ID.
+        
+        A hex microsecond timestamp plus 24 random bits: ids sort by upload
+        time and stay unique for identical files uploaded concurrently.
+        """
+        return f"{time.time_ns() // 1000:x}{secrets.token_hex(3)}"
     
     async def add_audio_file(self, file_path: str, metadata: Dict[str, Any]) -> AudioFileNode:
         """Add a new audio file to the manager."""
@@ -302,6 +307,7 @@ class AudioFileManager:
             filename = file_path.name
             file_size = file_path.stat().st_size
             file_id = self.generate_file_id(filename, file_size)
+            now = datetime.now().isoformat()
             
             # Create audio file node
             audio_file = AudioFileNode(
@@ -314,8 +320,8 @@ class AudioFileManager:
                 channels=metadata.get('channels', 2),
                 bit_depth=metadata.get('bit_depth', 16),
                 format=metadata.get('format', 'wav'),
-                upload_time=datetime.now().isoformat(),
-                last_accessed=datetime.now().isoformat(),
+                upload_time=now,
+                last_accessed=now,
                 access_count=1,
                 tags=metadata.get('tags', []),
                 metadata=metadata,
@@ -4,8 +4,10 @@ Defines the interface for all audio effect processors.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 import logging
+import threading
 import time
 import numpy as np
 
@@ -20,6 +22,9 @@ class AudioEffectProcessor(ABC):
     consistent behavior and error handling.
     """
     
+    # Largest scratch array kept between calls, matching Float32BufferPool
+    MAX_SCRATCH_SAMPLES = 1 << 22
+    
     def __init__(self, sample_rate: int = 44100):
         """
         Initialize the audio effect processor.
@@ -29,10 +34,11 @@ class AudioEffectProcessor(ABC):
         """
         self.sample_rate = sample_rate
         self.name = self.__class__.__name__
+        self._scratch: Dict[str, np.ndarray] = {}
         logger.debug(f"Initialized {self.name} with sample_rate={sample_rate}")
     
     @abstractmethod
-    def apply(self, samples: List[float], parameters: Dict[str, Any]) -> List[float]:
+    def apply(self, samples: Union[np.ndarray, List[float]], parameters: Dict[str, Any]) -> np.ndarray:
         """
         Apply the audio effect to samples.
         
@@ -41,17 +47,33 @@ class AudioEffectProcessor(ABC):
             parameters: Effect-specific parameters
             
         Returns:
-            Processed audio samples
+            Processed audio samples as a float32 array
             
         Raises:
             AudioProcessingFailedError: If processing fails
         """
         pass
     
-    def process_with_timing(self, samples: List[float], parameters: Dict[str, Any]) -> tuple[List[float], float]:
+    def apply_list(self, samples: List[float], parameters: Dict[str, Any]) -> List[float]:
+        """
+        Apply the audio effect for callers that need plain Python lists.
+        
+        Args:
+            samples: Input audio samples
+            parameters: Effect-specific parameters
+            
+        Returns:
+            Processed audio samples as a list
+        """
+        return self.apply(samples, parameters).tolist()
+    
+    def process_with_timing(self, samples: Union[np.ndarray, List[float]], parameters: Dict[str, Any]) -> tuple[np.ndarray, float]:
         """
         Apply effect with timing measurement.
         
+        Instances keep scratch buffers and plugin state, so concurrent
+        callers should each check one out with AudioProcessorFactory.acquire.
+        
         Args:
             samples: Input audio samples
             parameters: Effect-specific parameters
@@ -65,7 +87,7 @@ class AudioEffectProcessor(ABC):
             processed_samples = self.apply(samples, parameters)
             processing_time = (time.time() - start_time) * 1000  # Convert to milliseconds
             
-            logger.debug(f"{self.name} processed {len(samples)} samples in {processing_time:.2f}ms")
+            logger.debug("%s processed %d samples in %.2fms", self.name, len(samples), processing_time)
             return processed_samples, processing_time
             
         except Exception as e:
@@ -110,10 +132,12 @@ class AudioEffectProcessor(ABC):
             "parameters": {}
         }
     
-    def _validate_samples(self, samples: List[float]) -> np.ndarray:
+    def _validate_samples(self, samples: Union[np.ndarray, List[float]]) -> np.ndarray:
         """
         Validate and convert samples to numpy array.
         
+        Float32 arrays are used as-is without copying.
+        
         Args:
             samples: Input samples
             
@@ -123,17 +147,16 @@ class AudioEffectProcessor(ABC):
         Raises:
             ValueError: If samples are invalid
         """
-        if not samples:
+        if len(samples) == 0:
             raise ValueError("Samples list cannot be empty")
         
         try:
-            samples_array = np.array(samples, dtype=np.float32)
-            
-            # Check for invalid values
-            if np.any(np.isnan(samples_array)):
-                raise ValueError("Samples contain NaN values")
+            samples_array = np.asarray(samples, dtype=np.float32)
             
-            if np.any(np.isinf(samples_array)):
+            # Check for invalid values in a single pass
+            if not np.isfinite(samples_array).all():
+                if np.any(np.isnan(samples_array)):
+                    raise ValueError("Samples contain NaN values")
                 raise ValueError("Samples contain infinite values")
             
             return samples_array
@@ -156,20 +179,47 @@ class AudioEffectProcessor(ABC):
             return np.mean(samples, axis=1)
         return samples
     
+    def _buf(self, name: str, length: int, dtype: Any = np.float32) -> np.ndarray:
+        """
+        Get a reusable scratch array, growing its backing storage as needed.
+        
+        Contents are left over from the previous call; callers that need
+        zero-initialised memory must fill it themselves. Requests above
+        MAX_SCRATCH_SAMPLES get a plain allocation that is not cached, so a
+        single long input does not stay pinned by the shared processor.
+        
+        Args:
+            name: Scratch buffer name
+            length: Number of elements required
+            dtype: Element type
+            
+        Returns:
+            Scratch array view of the requested length
+        """
+        if length > self.MAX_SCRATCH_SAMPLES:
+            return np.empty(length, dtype=dtype)
+        
+        buf = self._scratch.get(name)
+        if buf is None or len(buf) < length or buf.dtype != dtype:
+            buf = np.empty(length, dtype=dtype)
+            self._scratch[name] = buf
+        return buf[:length]
+    
     def _normalize_output(self, samples: np.ndarray) -> np.ndarray:
         """
-        Normalize output samples to prevent clipping.
+        Normalize output samples in place to prevent clipping.
         
         Args:
-            samples: Input samples array
+            samples: Input samples array, owned by the caller's output path
             
         Returns:
             Normalized samples array
         """
-        max_val = np.max(np.abs(samples))
+        # Peak from max/min avoids allocating an abs() temporary
+        max_val = max(float(samples.max()), -float(samples.min()))
         if max_val > 1.0:
             # Normalize to prevent clipping
-            samples = samples / max_val
+            np.divide(samples, max_val, out=samples)
             logger.warning(f"{self.name} output normalized to prevent clipping")
         
         return samples
@@ -184,6 +234,9 @@ class AudioProcessorFactory:
     """
     
     _processors: Dict[str, type] = {}
+    _instances: Dict[Tuple[str, int], AudioEffectProcessor] = {}
+    _idle: Dict[Tuple[str, int], List[AudioEffectProcessor]] = {}
+    _idle_lock = threading.Lock()
     
     @classmethod
     def register(cls, effect_name: str, processor_class: type) -> None:
@@ -198,6 +251,14 @@ class AudioProcessorFactory:
             raise ValueError(f"Processor class must inherit from AudioEffectProcessor")
         
         cls._processors[effect_name.lower()] = processor_class
+        
+        # Drop shared instances of any previously registered class
+        for key in [key for key in cls._instances if key[0] == effect_name.lower()]:
+            del cls._instances[key]
+        with cls._idle_lock:
+            for key in [key for key in cls._idle if key[0] == effect_name.lower()]:
+                del cls._idle[key]
+        
         logger.info(f"Registered audio processor: {effect_name}")
     
     @classmethod
@@ -215,15 +276,77 @@ class AudioProcessorFactory:
         Raises:
             ValueError: If effect is not supported
         """
-        effect_name_lower = effect_name.lower()
-        
-        if effect_name_lower not in cls._processors:
+        processor_class = cls._processors.get(effect_name.lower())
+        if processor_class is None:
             supported_effects = list(cls._processors.keys())
             raise ValueError(f"Unsupported effect '{effect_name}'. Supported effects: {supported_effects}")
         
-        processor_class = cls._processors[effect_name_lower]
         return processor_class(sample_rate)
     
+    @classmethod
+    def get(cls, effect_name: str, sample_rate: int = 44100) -> AudioEffectProcessor:
+        """
+        Get a shared audio effect processor, creating it on first use.
+        
+        Processors are reused across sessions with the same sample rate so
+        that backend setup is not rebuilt per lookup. Use acquire instead
+        when processing, since the shared instance is not reserved for the
+        caller.
+        
+        Args:
+            effect_name: Name of the effect
+            sample_rate: Audio sample rate
+            
+        Returns:
+            Shared AudioEffectProcessor instance
+            
+        Raises:
+            ValueError: If effect is not supported
+        """
+        key = (effect_name.lower(), sample_rate)
+        processor = cls._instances.get(key)
+        if processor is None:
+            processor = cls.create(effect_name, sample_rate)
+            cls._instances[key] = processor
+        return processor
+    
+    @classmethod
+    @contextmanager
+    def acquire(cls, effect_name: str, sample_rate: int = 44100) -> Iterator[AudioEffectProcessor]:
+        """
+        Check out a processor for exclusive use by the calling thread.
+        
+        Idle processors are reused, so backend setup and scratch buffers
+        survive between requests; a new one is created only when every
+        processor for this effect and sample rate is busy. Concurrent
+        requests therefore run in parallel instead of queueing on one
+        shared instance.
+        
+        Args:
+            effect_name: Name of the effect
+            sample_rate: Audio sample rate
+            
+        Yields:
+            AudioEffectProcessor instance not used by any other caller
+            
+        Raises:
+            ValueError: If effect is not supported
+        """
+        key = (effect_name.lower(), sample_rate)
+        with cls._idle_lock:
+            idle = cls._idle.get(key)
+            processor = idle.pop() if idle else None
+        if processor is None:
+            processor = cls.create(effect_name, sample_rate)
+        
+        try:
+            yield processor
+        finally:
+            with cls._idle_lock:
+                # Skip processors whose effect was re-registered meanwhile
+                if type(processor) is cls._processors.get(key[0]):
+                    cls._idle.setdefault(key, []).append(processor)
+    
     @classmethod
     def get_supported_effects(cls) -> List[str]:
         """Get list of supported effect names."""
@@ -241,7 +364,7 @@ class AudioProcessorFactory:
             Effect information or None if not found
         """
         try:
-            processor = cls.create(effect_name)
+            processor = cls.get(effect_name)
             return processor.get_parameter_info()
         except ValueError:
             return None 
\ No newline at end of file
@@ -3,16 +3,42 @@ Reverb Audio Processor using Pedalboard library.
 Provides high-quality reverb effects using Spotify's Pedalboard library.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import numpy as np
 import logging
 
+from scipy.signal import lfilter
+
 from .base import AudioEffectProcessor
 from app.core.errors import AudioProcessingFailedError
 
 logger = logging.getLogger(__name__)
 
 
+def _exponential_tail(samples: np.ndarray, decay: float, tail_length: int) -> np.ndarray:
+    """
+    Filter samples with a truncated, unit-sum exponential impulse response.
+    
+    Convolving with h[k] = decay**k for k < tail_length equals a one-pole
+    recursive filter minus the same filter delayed by tail_length, so the
+    result is exact in O(N) without materialising the impulse response.
+    The recursion runs in float64 for accuracy; the result is float32.
+    """
+    wet = lfilter([1.0], [1.0, -decay], samples.astype(np.float64))
+    
+    # Cancel the part of the recursion beyond the truncated tail
+    if tail_length < len(wet):
+        wet[tail_length:] -= decay ** tail_length * wet[:-tail_length]
+    
+    if decay < 1.0:
+        tail_sum = -np.expm1(tail_length * np.log(decay)) / (1.0 - decay)
+    else:
+        tail_sum = float(tail_length)
+    
+    wet /= tail_sum
+    return wet.astype(np.float32)
+
+
 class ReverbProcessor(AudioEffectProcessor):
     """
     High-quality reverb processor using Pedalboard.
@@ -40,7 +66,7 @@ class ReverbProcessor(AudioEffectProcessor):
             self.pedalboard = None
             self.reverb_plugin = None
     
-    def apply(self, samples: List[float], parameters: Dict[str, Any]) -> List[float]:
+    def apply(self, samples: Union[np.ndarray, List[float]], parameters: Dict[str, Any]) -> np.ndarray:
         """
         Apply reverb effect to audio samples.
         
@@ -74,7 +100,7 @@ class ReverbProcessor(AudioEffectProcessor):
                 details={"parameters": parameters}
             )
     
-    def _apply_pedalboard_reverb(self, samples: np.ndarray, parameters: Dict[str, Any]) -> List[float]:
+    def _apply_pedalboard_reverb(self, samples: np.ndarray, parameters: Dict[str, Any]) -> np.ndarray:
         """Apply reverb using Pedalboard library."""
         try:
             # Configure reverb plugin
@@ -90,14 +116,15 @@ class ReverbProcessor(AudioEffectProcessor):
             # Ensure mono output
             if len(processed_samples.shape) > 1:
                 processed_samples = np.mean(processed_samples, axis=1)
+            processed_samples = processed_samples.astype(np.float32, copy=False)
             
             # Normalize output
             processed_samples = self._normalize_output(processed_samples)
             
-            logger.debug(f"Applied Pedalboard reverb: room_size={parameters.get('room_size')}, "
-                        f"damping={parameters.get('damping')}, wet_level={parameters.get('wet_level')}")
+            logger.debug("Applied Pedalboard reverb: room_size=%s, damping=%s, wet_level=%s",
+                         parameters.get('room_size'), parameters.get('damping'), parameters.get('wet_level'))
             
-            return processed_samples.tolist()
+            return processed_samples
             
         except Exception as e:
             logger.error(f"Pedalboard reverb failed: {e}")
@@ -106,32 +133,31 @@ class ReverbProcessor(AudioEffectProcessor):
                 error_code="PEDALBOARD_REVERB_ERROR"
             )
     
-    def _apply_basic_reverb(self, samples: np.ndarray, parameters: Dict[str, Any]) -> List[float]:
-        """Apply basic reverb using convolution (fallback method)."""
+    def _apply_basic_reverb(self, samples: np.ndarray, parameters: Dict[str, Any]) -> np.ndarray:
+        """Apply basic reverb using an exponentially decaying tail (fallback method)."""
         try:
             room_size = parameters.get('room_size', 0.5)
             damping = parameters.get('damping', 0.5)
             wet_level = parameters.get('wet_level', 0.33)
             dry_level = parameters.get('dry_level', 0.4)
             
-            # Create reverb impulse response
-            reverb_length = int(room_size * self.sample_rate * 2)  # 2 seconds max
-            reverb_tail = np.exp(-damping * np.arange(reverb_length) / self.sample_rate)
-            reverb_tail = reverb_tail / np.sum(reverb_tail)
-            
-            # Apply convolution
-            reverb_signal = np.convolve(samples, reverb_tail, mode='full')
-            reverb_signal = reverb_signal[:len(samples)]
+            # Reverb tail decays by exp(-damping) per second, 2 seconds max
+            reverb_length = max(int(room_size * self.sample_rate * 2), 1)
+            decay = np.exp(-damping / self.sample_rate)
+            reverb_signal = _exponential_tail(samples, decay, reverb_length)
             
-            # Mix dry and wet signals
-            output = dry_level * samples + wet_level * reverb_signal
+            # Mix dry and wet signals in place
+            dry_signal = self._buf('dry', len(samples))
+            np.multiply(samples, dry_level, out=dry_signal)
+            np.multiply(reverb_signal, wet_level, out=reverb_signal)
+            np.add(reverb_signal, dry_signal, out=reverb_signal)
             
             # Normalize output
-            output = self._normalize_output(output)
+            output = self._normalize_output(reverb_signal)
             
-            logger.debug(f"Applied basic reverb: room_size={room_size}, damping={damping}")
+            logger.debug("Applied basic reverb: room_size=%s, damping=%s", room_size, damping)
             
-            return output.tolist()
+            return output
             
         except Exception as e:
             logger.error(f"Basic reverb failed: {e}")
@@ -0,0 +1,85 @@
+"""
+Float32 Buffer Pool for the Audio Processing Backend.
+Provides reusable scratch arrays for audio I/O to avoid per-request allocations.
+"""
+
+import numpy as np
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Float32BufferPool:
+    """
+    Thread-safe pool of float32 scratch arrays.
+    
+    Arrays are pooled by power-of-two capacity so that requests of
+    similar sizes share storage; acquire() returns a view of the
+    requested length. Requests above the pooled limit are served with a
+    plain allocation and are simply dropped on release.
+    """
+    
+    def __init__(self, max_pooled_samples: int = 1 << 22, max_per_class: int = 4):
+        """
+        Initialize the buffer pool.
+        
+        Args:
+            max_pooled_samples: Largest capacity kept in the pool, in samples
+            max_per_class: Maximum idle arrays retained per capacity class
+        """
+        self.max_pooled_samples = max_pooled_samples
+        self.max_per_class = max_per_class
+        self._free: Dict[int, Deque[np.ndarray]] = {}
+        self.lock = Lock()
+    
+    def acquire(self, size: int) -> np.ndarray:
+        """
+        Get a float32 array of the given length.
+        
+        Contents are undefined; callers must overwrite before reading.
+        
+        Args:
+            size: Number of samples required
+            
+        Returns:
+            Float32 array of length size
+        """
+        capacity = 1 << max(size - 1, 0).bit_length()
+        if capacity > self.max_pooled_samples:
+            return np.empty(size, dtype=np.float32)
+        
+        with self.lock:
+            free = self._free.get(capacity)
+            storage = free.pop() if free else None
+        
+        if storage is None:
+            storage = np.empty(capacity, dtype=np.float32)
+        return storage[:size]
+    
+    def release(self, buf: np.ndarray) -> None:
+        """
+        Return an array obtained from acquire() to the pool.
+        
+        Args:
+            buf: Array previously returned by acquire()
+        """
+        storage = buf.base if buf.base is not None else buf
+        capacity = len(storage)
+        if capacity > self.max_pooled_samples or capacity & (capacity - 1):
+            return
+        
+        with self.lock:
+            free = self._free.setdefault(capacity, deque())
+            if len(free) < self.max_per_class:
+                free.append(storage)
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """Get pool statistics."""
+        with self.lock:
+            return {
+                'pooled_arrays': sum(len(free) for free in self._free.values()),
+                'pooled_samples': sum(capacity * len(free) for capacity, free in self._free.items())
+            }
@@ -0,0 +1,104 @@
+"""
+Processing History Writer for the Audio Processing Backend.
+Batches processing history inserts through a single background task.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.db.session import AsyncSessionLocal
+from app.models.db import ProcessingHistory
+
+logger = logging.getLogger(__name__)
+
+# Queue marker that tells the writer task to finish
+_STOP = object()
+
+
+class ProcessingHistoryWriter:
+    """
+    Background writer for ProcessingHistory rows.
+
+    Request handlers enqueue rows without waiting on the database; one
+    task inserts them in batches with a single commit per batch, so the
+    commit cost is shared by every row that arrived in the same window.
+    """
+
+    def __init__(self, max_batch_size: int = 500, flush_interval: float = 0.05):
+        """
+        Initialize the history writer.
+
+        Args:
+            max_batch_size: Maximum rows inserted per commit
+            flush_interval: Seconds to wait for more rows after the first
+        """
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.total_written = 0
+        self.total_failed = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Processing history writer started")
+
+    async def stop(self) -> None:
+        """Write all queued rows and stop the background task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(_STOP)
+        await self._task
+        self._task = None
+        logger.info(f"Processing history writer stopped: {self.total_written} rows written")
+
+    def enqueue(self, **row: Any) -> None:
+        """
+        Queue a ProcessingHistory row for insertion.
+
+        Args:
+            **row: Column values; processed_at defaults to the current time
+        """
+        row.setdefault('processed_at', datetime.now(timezone.utc))
+        self._queue.put_nowait(row)
+
+    async def _run(self) -> None:
+        """Collect rows into batches until the stop marker is reached."""
+        while True:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+
+            # Give concurrent requests a moment to join this batch
+            await asyncio.sleep(self.flush_interval)
+
+            rows = [first]
+            stopping = False
+            while len(rows) < self.max_batch_size and not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is _STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            await self._flush(rows)
+            if stopping:
+                return
+
+    async def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert a batch of rows in one executemany and commit."""
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(ProcessingHistory), rows)
+                await session.commit()
+            self.total_written += len(rows)
+            logger.debug("Wrote %d processing history rows", len(rows))
+        except Exception as e:
+            self.total_failed += len(rows)
+            logger.error(f"Failed to write {len(rows)} processing history rows: {e}")
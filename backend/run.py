@@ -3,6 +3,8 @@
 Simple script to run the new audio processing backend.
 """
 
+import sys
+
 import uvicorn
 from app.core.config import settings
 
@@ -16,10 +18,18 @@ if __name__ == "__main__":
     print(f"Buffer Size: {settings.default_buffer_size} samples")
     print("\nStarting server...")
     
+    # Single worker: session buffers and WebSocket connections live in
+    # process memory, so extra workers would each see a different subset.
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no
+    # Windows build.
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws_per_message_deflate=settings.ws_per_message_deflate,
+        ws_max_size=settings.ws_max_size
     ) 
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Tests for AudioBuffer.process_in_place conflict detection.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.errors import BufferConflictError
+from app.services.audio_buffer import AudioBuffer
+
+
+def _filled_buffer(size: int = 16, count: int = 8, read_first: int = 0) -> AudioBuffer:
+    """Create a buffer holding samples 1..count, optionally wrapped around the ring end."""
+    buffer = AudioBuffer(size, sample_rate=8000)
+    if read_first:
+        buffer.write(np.zeros(read_first, dtype=np.float32))
+        buffer.read_ndarray(read_first)
+    buffer.write(np.arange(1, count + 1, dtype=np.float32))
+    return buffer
+
+
+@pytest.mark.parametrize("read_first", [0, 12])
+def test_concurrent_write_keeps_processed_and_appended_samples(read_first):
+    buffer = _filled_buffer(read_first=read_first)
+    appended = np.full(4, -1.0, dtype=np.float32)
+
+    def transform(samples):
+        assert buffer.write(appended) == len(appended)
+        return samples * 2
+
+    result = buffer.process_in_place(transform)
+
+    np.testing.assert_array_equal(result, np.arange(1, 9, dtype=np.float32) * 2)
+    expected = np.concatenate((np.arange(1, 9, dtype=np.float32) * 2, appended))
+    np.testing.assert_array_equal(buffer.read_ndarray(12), expected)
+
+
+@pytest.mark.parametrize("interfere", [
+    lambda buffer: buffer.read_ndarray(1),
+    lambda buffer: buffer.clear(),
+    lambda buffer: (buffer.clear(), buffer.write(np.zeros(8, dtype=np.float32))),
+], ids=["read", "clear", "clear_and_refill"])
+def test_concurrent_read_or_clear_raises_conflict(interfere):
+    buffer = _filled_buffer()
+    ring_after_interference = []
+
+    def transform(samples):
+        interfere(buffer)
+        ring_after_interference.append(buffer.buffer.copy())
+        return samples * 2
+
+    with pytest.raises(BufferConflictError):
+        buffer.process_in_place(transform)
+
+    # The transform output is discarded rather than written over the ring
+    np.testing.assert_array_equal(buffer.buffer, ring_after_interference[0])
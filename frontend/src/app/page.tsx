@@ -18,7 +18,7 @@ export default function Home() {
   const [uploadedFiles, setUploadedFiles] = useState<Array<{name: string, size: number, duration: number}>>([])
   const [isProcessing, setIsProcessing] = useState(false)
   const [activeEffects, setActiveEffects] = useState<string[]>([])
-  const [processedAudio, setProcessedAudio] = useState<{sessionId: string, effect: string} | null>(null)
+  const [processedAudio, setProcessedAudio] = useState<{sessionId: string, effect: string, url: string | null} | null>(null)
 
   const [audioLevels, setAudioLevels] = useState({ level: 0, peak: 0 })
   const [frequencyData, setFrequencyData] = useState<number[]>([])
@@ -269,7 +269,8 @@ export default function Home() {
         // Set processed audio info for the player
         setProcessedAudio({
           sessionId: data.session_id,
-          effect: effect.toLowerCase()
+          effect: effect.toLowerCase(),
+          url: data.processed_file_url
         })
         
         toast.success(`${effect} effect applied successfully! Listen to the result below.`)
@@ -578,7 +579,7 @@ export default function Home() {
                 </div>
               )}
 
-              {processedAudio && (
+              {processedAudio?.url && (
                 <div className="mt-4 p-3 bg-purple-500/10 border border-purple-500/20 rounded-lg">
                   <h4 className="text-sm font-medium text-purple-400 mb-3">
                     🎵 Processed Audio: {processedAudio.effect}
@@ -590,7 +591,7 @@ export default function Home() {
                       <audio 
                         controls 
                         className="flex-1"
-                        src={`http://localhost:8000/api/audio/processed/${processedAudio.sessionId}/${processedAudio.effect}`}
+                        src={`http://localhost:8000${processedAudio.url}`}
                       >
                         Your browser does not support the audio element.
                       </audio>